@@ -43,7 +43,6 @@ import re
 import urllib.parse
 import urllib.request
 import pathlib
-from copy import deepcopy
 
 from dateutil.parser import parse as dateparse
 import pytz
@@ -67,8 +66,8 @@ from pygeoapi.provider.tile import (ProviderTileNotFoundError,
 from pygeoapi.util import (dategetter, DATETIME_FORMAT,
                            filter_dict_by_key_value, get_provider_by_type,
                            get_provider_default, get_typed_value, JobStatus,
-                           json_serial, render_j2_template, str2bool,
-                           TEMPLATES, to_json)
+                           json_loads, json_serial, render_j2_template,
+                           str2bool, TEMPLATES, to_json)
 
 LOGGER = logging.getLogger(__name__)
 
@@ -1919,14 +1918,15 @@ tiles/{{{}}}/{{{}}}/{{{}}}/{{{}}}?f=mvt'
                 p = load_plugin('process',
                                 processes_config[key]['processor'])
 
-                p2 = deepcopy(p.metadata)
+                # only top level keys and links are modified below
+                p2 = dict(p.metadata)
 
                 p2['jobControlOptions'] = ['sync-execute']
                 if self.manager.is_async:
                     p2['jobControlOptions'].append('async-execute')
 
                 p2['outputTransmission'] = ['value']
-                p2['links'] = p2.get('links', [])
+                p2['links'] = list(p2.get('links', []))
 
                 process_url = '{}/processes/{}'.format(self.config['server']['url'], key)
                 jobs_url = '{}/jobs'.format(process_url)
@@ -2263,8 +2263,7 @@ tiles/{{{}}}/{{{}}}/{{{}}}/{{{}}}?f=mvt'
             },
         ]
 
-        with notebook_for_process(process_id).open() as nb_file:
-            nb_content = json.load(nb_file)
+        nb_content = read_notebook(notebook_for_process(process_id))
 
         nb_content['cells'] = prelude + nb_content['cells']
 
@@ -2360,8 +2359,7 @@ tiles/{{{}}}/{{{}}}/{{{}}}/{{{}}}?f=mvt'
         return self.get_process_job_result(headers, args, notebook_process_id, job_id)
 
     def describe_coverage_process(self, process_id):
-        with notebook_for_process(process_id).open() as nb_file:
-            nb_contents = json.load(nb_file)
+        nb_contents = read_notebook(notebook_for_process(process_id))
 
         process_meta = {}
         # Warning: don't look at the next line
@@ -2879,4 +2877,17 @@ def notebook_for_process(process_id):
         if process_id != GENERIC_PROCESS_ID
         else COVERAGE_PROCESS_NOTEBOOKS_DIR.parent
     )
-    return nb_dir / f"{process_id}.ipynb"
\ No newline at end of file
+    return nb_dir / f"{process_id}.ipynb"
+
+
+def read_notebook(nb_path):
+    """
+    Read and parse a notebook
+
+    :param nb_path: `pathlib.Path` of the notebook
+
+    :returns: `dict` of notebook content
+    """
+
+    with nb_path.open('rb') as nb_file:
+        return json_loads(nb_file.read())
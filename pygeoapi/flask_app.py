@@ -30,30 +30,43 @@
 
 """ Flask module providing the route paths to the api"""
 
+from collections import OrderedDict
+import functools
+import hashlib
 import os
+import threading
+import time
 
 import click
 
-from flask import Flask, Blueprint, make_response, request, send_from_directory
+from flask import (Flask, Blueprint, abort, make_response, request,
+                   send_from_directory)
 
-from pygeoapi.api import API
+from pygeoapi.api import API, check_format
 from pygeoapi.util import get_mimetype, yaml_load
 
 
 CONFIG = None
+OPENAPI = None
 
 if 'PYGEOAPI_CONFIG' not in os.environ:
     raise RuntimeError('PYGEOAPI_CONFIG environment variable not set')
 
+if 'PYGEOAPI_OPENAPI' not in os.environ:
+    raise RuntimeError('PYGEOAPI_OPENAPI environment variable not set')
+
 with open(os.environ.get('PYGEOAPI_CONFIG'), encoding='utf8') as fh:
     CONFIG = yaml_load(fh)
 
+with open(os.environ.get('PYGEOAPI_OPENAPI'), encoding='utf8') as fh:
+    OPENAPI = yaml_load(fh)
+
 STATIC_FOLDER = 'static'
 if 'templates' in CONFIG['server']:
     STATIC_FOLDER = CONFIG['server']['templates'].get('static', 'static')
 
 APP = Flask(__name__, static_folder=STATIC_FOLDER, static_url_path='/static')
-APP.url_map.strict_slashes = False
+APP.url_map.strict_slashes = True
 
 BLUEPRINT = Blueprint('pygeoapi', __name__, static_folder=STATIC_FOLDER)
 
@@ -63,10 +76,158 @@ if CONFIG['server'].get('cors', False):
     CORS(APP)
 
 APP.config['JSONIFY_PRETTYPRINT_REGULAR'] = CONFIG['server'].get(
-    'pretty_print', True)
+    'pretty_print', False)
+
+# reject request bodies above this size (in bytes) with HTTP 413
+APP.config['MAX_CONTENT_LENGTH'] = CONFIG['server'].get(
+    'max_content_length', None)
+
+# let the fronting web server send local files (OGC schemas, static files)
+# via the X-Sendfile header; needs Apache mod_xsendfile or lighttpd, nginx
+# ignores X-Sendfile and would serve empty responses
+APP.config['USE_X_SENDFILE'] = CONFIG['server'].get('x_sendfile', False)
 
 api_ = API(CONFIG)
 
+
+# largest response body (in bytes) to hash for an ETag on every request;
+# cached responses are hashed once when they are cached
+ETAG_MAX_CONTENT_LENGTH = 1 << 20
+
+
+def compute_etag(content):
+    """
+    Compute the ETag of a response body
+
+    :param content: `str` or `bytes` of response body
+
+    :returns: `str` of ETag
+    """
+
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+
+    return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+
+def cache_by_format(api_call):
+    """
+    Memoize an API call whose response only depends on the requested
+    format (e.g. landing page, conformance, OpenAPI document)
+
+    :param api_call: callable taking request headers and args
+
+    :returns: callable taking request headers and args, returning
+              the cached tuple of headers, status code, content and
+              the ETag of the content
+    """
+
+    @functools.lru_cache(maxsize=16)
+    def cached(format_):
+        args = {'f': format_} if format_ else {}
+        headers_, status_code, content = api_call({}, args)
+        return headers_, status_code, content, compute_etag(content)
+
+    def inner(headers, args):
+        headers_, status_code, content, etag = cached(
+            check_format(args, headers))
+        return (headers_.copy(), status_code, content), etag
+
+    return inner
+
+
+cached_landing_page = cache_by_format(api_.landing_page)
+cached_conformance = cache_by_format(api_.conformance)
+cached_openapi = cache_by_format(
+    lambda headers, args: api_.openapi(headers, args, OPENAPI))
+
+
+TILES_CACHE = OrderedDict()
+TILES_CACHE_LOCK = threading.Lock()
+TILES_CACHE_SIZE = CONFIG['server'].get('tiles_cache_size', 256)
+TILES_MAX_AGE = 3600
+
+
+def cached_tile(collection_id, tileMatrixSetId, tileMatrix, tileRow,
+                tileCol, headers, args):
+    """
+    Fetch a collection tile, memoizing successful responses in a bounded
+    in-process LRU cache for up to `TILES_MAX_AGE` seconds
+
+    :param collection_id: collection identifier
+    :param tileMatrixSetId: identifier of tile matrix set
+    :param tileMatrix: identifier of {z} matrix index
+    :param tileRow: identifier of {y} matrix index
+    :param tileCol: identifier of {x} matrix index
+    :param headers: request headers
+    :param args: request args
+
+    :returns: tuple of (headers, status code, content) and the ETag of
+              the content (`None` if the tile was not cached)
+    """
+
+    key = (collection_id, tileMatrixSetId, tileMatrix, tileRow, tileCol,
+           check_format(args, headers))
+
+    with TILES_CACHE_LOCK:
+        entry = TILES_CACHE.get(key)
+        if entry is not None:
+            cached_at, (headers_, status_code, content), etag = entry
+            if time.monotonic() - cached_at < TILES_MAX_AGE:
+                TILES_CACHE.move_to_end(key)
+                return (headers_.copy(), status_code, content), etag
+            # expired: the tile may have changed since
+            del TILES_CACHE[key]
+
+    result = api_.get_collection_tiles_data(
+        headers, args, collection_id, tileMatrixSetId, tileMatrix, tileRow,
+        tileCol)
+
+    if result[1] not in (200, 202) or not TILES_CACHE_SIZE:
+        return result, None
+
+    etag = compute_etag(result[2])
+    with TILES_CACHE_LOCK:
+        TILES_CACHE[key] = (time.monotonic(), result, etag)
+        while len(TILES_CACHE) > TILES_CACHE_SIZE:
+            TILES_CACHE.popitem(last=False)
+
+    return result, etag
+
+
+def get_response(result, etag=None):
+    """
+    Creates a Flask response from the result of an API call, with an
+    ETag so that repeated GET requests can be answered with 304
+
+    :param result: `tuple` of headers, status code, content
+    :param etag: precomputed ETag of content (e.g. of a cached response);
+                 if `None`, bodies up to `ETAG_MAX_CONTENT_LENGTH` bytes
+                 are hashed
+
+    :returns: HTTP response
+    """
+
+    headers, status_code, content = result
+
+    response = make_response(content, status_code)
+
+    if headers:
+        response.headers.update(headers)
+
+    # conditional GET: answer 304 when the client already has this content
+    if request.method == 'GET' and 200 <= response.status_code < 300:
+        length = response.content_length
+        if etag is None and length is not None and \
+                length <= ETAG_MAX_CONTENT_LENGTH:
+            etag = compute_etag(response.get_data())
+        if etag is not None:
+            response.set_etag(etag)
+            response.make_conditional(request)
+
+    return response
+
+
 OGC_SCHEMAS_LOCATION = CONFIG['server'].get('ogc_schemas_location', None)
 
 if (OGC_SCHEMAS_LOCATION is not None and
@@ -76,6 +237,29 @@ if (OGC_SCHEMAS_LOCATION is not None and
     if not os.path.exists(OGC_SCHEMAS_LOCATION):
         raise RuntimeError('OGC schemas misconfigured')
 
+    OGC_SCHEMAS_REALPATH = os.path.realpath(OGC_SCHEMAS_LOCATION)
+
+    @functools.lru_cache(maxsize=1024)
+    def schema_location(path):
+        """
+        Resolve the directory, filename and mimetype of an OGC schema
+
+        :param path: path of the OGC schema document
+
+        :returns: `tuple` of directory, filename and mimetype, or `None`
+                  if the path resolves outside of the schemas location
+        """
+
+        full_filepath = os.path.realpath(
+            os.path.join(OGC_SCHEMAS_REALPATH, path))
+
+        if not full_filepath.startswith(OGC_SCHEMAS_REALPATH + os.sep):
+            return None
+
+        basename_ = os.path.basename(full_filepath)
+        return (os.path.dirname(full_filepath), basename_,
+                get_mimetype(basename_))
+
     @APP.route('/schemas/<path:path>', methods=['GET'])
     def schemas(path):
         """
@@ -86,14 +270,12 @@ if (OGC_SCHEMAS_LOCATION is not None and
         :returns: HTTP response
         """
 
-        full_filepath = os.path.join(OGC_SCHEMAS_LOCATION, path)
-        dirname_ = os.path.dirname(full_filepath)
-        basename_ = os.path.basename(full_filepath)
+        location = schema_location(path)
+        if location is None:
+            abort(403)
 
-        # TODO: better sanitization?
-        path_ = dirname_.replace('..', '').replace('//', '')
-        return send_from_directory(path_, basename_,
-                                   mimetype=get_mimetype(basename_))
+        path_, basename_, mimetype = location
+        return send_from_directory(path_, basename_, mimetype=mimetype)
 
 
 @BLUEPRINT.route('/')
@@ -103,39 +285,22 @@ def landing_page():
 
     :returns: HTTP response
     """
-    headers, status_code, content = api_.landing_page(
-        request.headers, request.args)
-
-    response = make_response(content, status_code)
-
-    if headers:
-        response.headers = headers
-
-    return response
+    return get_response(*cached_landing_page(request.headers, request.args))
 
 
 @BLUEPRINT.route('/openapi')
+@BLUEPRINT.route('/openapi/')
 def openapi():
     """
     OpenAPI endpoint
 
     :returns: HTTP response
     """
-    with open(os.environ.get('PYGEOAPI_OPENAPI'), encoding='utf8') as ff:
-        openapi = yaml_load(ff)
-
-    headers, status_code, content = api_.openapi(request.headers, request.args,
-                                                 openapi)
-
-    response = make_response(content, status_code)
-
-    if headers:
-        response.headers = headers
-
-    return response
+    return get_response(*cached_openapi(request.headers, request.args))
 
 
 @BLUEPRINT.route('/conformance')
+@BLUEPRINT.route('/conformance/')
 def conformance():
     """
     OGC API conformance endpoint
@@ -143,19 +308,13 @@ def conformance():
     :returns: HTTP response
     """
 
-    headers, status_code, content = api_.conformance(request.headers,
-                                                     request.args)
-
-    response = make_response(content, status_code)
-
-    if headers:
-        response.headers = headers
-
-    return response
+    return get_response(*cached_conformance(request.headers, request.args))
 
 
 @BLUEPRINT.route('/collections')
+@BLUEPRINT.route('/collections/')
 @BLUEPRINT.route('/collections/<collection_id>')
+@BLUEPRINT.route('/collections/<collection_id>/')
 def collections(collection_id=None):
     """
     OGC API collections endpoint
@@ -165,18 +324,12 @@ def collections(collection_id=None):
     :returns: HTTP response
     """
 
-    headers, status_code, content = api_.describe_collections(
-        request.headers, request.args, collection_id)
-
-    response = make_response(content, status_code)
-
-    if headers:
-        response.headers = headers
-
-    return response
+    return get_response(api_.describe_collections(
+        request.headers, request.args, collection_id))
 
 
 @BLUEPRINT.route('/collections/<collection_id>/queryables')
+@BLUEPRINT.route('/collections/<collection_id>/queryables/')
 def collection_queryables(collection_id=None):
     """
     OGC API collections querybles endpoint
@@ -186,19 +339,14 @@ def collection_queryables(collection_id=None):
     :returns: HTTP response
     """
 
-    headers, status_code, content = api_.get_collection_queryables(
-        request.headers, request.args, collection_id)
-
-    response = make_response(content, status_code)
-
-    if headers:
-        response.headers = headers
-
-    return response
+    return get_response(api_.get_collection_queryables(
+        request.headers, request.args, collection_id))
 
 
 @BLUEPRINT.route('/collections/<collection_id>/items')
+@BLUEPRINT.route('/collections/<collection_id>/items/')
 @BLUEPRINT.route('/collections/<collection_id>/items/<item_id>')
+@BLUEPRINT.route('/collections/<collection_id>/items/<item_id>/')
 def collection_items(collection_id, item_id=None):
     """
     OGC API collections items endpoint
@@ -210,21 +358,17 @@ def collection_items(collection_id, item_id=None):
     """
 
     if item_id is None:
-        headers, status_code, content = api_.get_collection_items(
+        result = api_.get_collection_items(
             request.headers, request.args, collection_id)
     else:
-        headers, status_code, content = api_.get_collection_item(
+        result = api_.get_collection_item(
             request.headers, request.args, collection_id, item_id)
 
-    response = make_response(content, status_code)
-
-    if headers:
-        response.headers = headers
-
-    return response
+    return get_response(result)
 
 
 @BLUEPRINT.route('/collections/<collection_id>/coverage')
+@BLUEPRINT.route('/collections/<collection_id>/coverage/')
 def collection_coverage(collection_id):
     """
     OGC API - Coverages coverage endpoint
@@ -234,18 +378,12 @@ def collection_coverage(collection_id):
     :returns: HTTP response
     """
 
-    headers, status_code, content = api_.get_collection_coverage(
-        request.headers, request.args, collection_id)
-
-    response = make_response(content, status_code)
-
-    if headers:
-        response.headers = headers
-
-    return response
+    return get_response(api_.get_collection_coverage(
+        request.headers, request.args, collection_id))
 
 
 @BLUEPRINT.route('/collections/<collection_id>/coverage/domainset')
+@BLUEPRINT.route('/collections/<collection_id>/coverage/domainset/')
 def collection_coverage_domainset(collection_id):
     """
     OGC API - Coverages coverage domainset endpoint
@@ -255,18 +393,12 @@ def collection_coverage_domainset(collection_id):
     :returns: HTTP response
     """
 
-    headers, status_code, content = api_.get_collection_coverage_domainset(
-        request.headers, request.args, collection_id)
-
-    response = make_response(content, status_code)
-
-    if headers:
-        response.headers = headers
-
-    return response
+    return get_response(api_.get_collection_coverage_domainset(
+        request.headers, request.args, collection_id))
 
 
 @BLUEPRINT.route('/collections/<collection_id>/coverage/rangetype')
+@BLUEPRINT.route('/collections/<collection_id>/coverage/rangetype/')
 def collection_coverage_rangetype(collection_id):
     """
     OGC API - Coverages coverage rangetype endpoint
@@ -276,18 +408,12 @@ def collection_coverage_rangetype(collection_id):
     :returns: HTTP response
     """
 
-    headers, status_code, content = api_.get_collection_coverage_rangetype(
-        request.headers, request.args, collection_id)
-
-    response = make_response(content, status_code)
-
-    if headers:
-        response.headers = headers
-
-    return response
+    return get_response(api_.get_collection_coverage_rangetype(
+        request.headers, request.args, collection_id))
 
 
 @BLUEPRINT.route('/collections/<collection_id>/tiles')
+@BLUEPRINT.route('/collections/<collection_id>/tiles/')
 def get_collection_tiles(collection_id=None):
     """
     OGC open api collections tiles access point
@@ -297,18 +423,12 @@ def get_collection_tiles(collection_id=None):
     :returns: HTTP response
     """
 
-    headers, status_code, content = api_.get_collection_tiles(
-        request.headers, request.args, collection_id)
-
-    response = make_response(content, status_code)
-
-    if headers:
-        response.headers = headers
-
-    return response
+    return get_response(api_.get_collection_tiles(
+        request.headers, request.args, collection_id))
 
 
 @BLUEPRINT.route('/collections/<collection_id>/tiles/<tileMatrixSetId>/metadata')  # noqa
+@BLUEPRINT.route('/collections/<collection_id>/tiles/<tileMatrixSetId>/metadata/')  # noqa
 def get_collection_tiles_metadata(collection_id=None, tileMatrixSetId=None):
     """
     OGC open api collection tiles service metadata
@@ -319,19 +439,14 @@ def get_collection_tiles_metadata(collection_id=None, tileMatrixSetId=None):
     :returns: HTTP response
     """
 
-    headers, status_code, content = api_.get_collection_tiles_metadata(
-        request.headers, request.args, collection_id, tileMatrixSetId)
-
-    response = make_response(content, status_code)
-
-    if headers:
-        response.headers = headers
-
-    return response
+    return get_response(api_.get_collection_tiles_metadata(
+        request.headers, request.args, collection_id, tileMatrixSetId))
 
 
 @BLUEPRINT.route('/collections/<collection_id>/tiles/\
 <tileMatrixSetId>/<tileMatrix>/<tileRow>/<tileCol>')
+@BLUEPRINT.route('/collections/<collection_id>/tiles/\
+<tileMatrixSetId>/<tileMatrix>/<tileRow>/<tileCol>/')
 def get_collection_tiles_data(collection_id=None, tileMatrixSetId=None,
                               tileMatrix=None, tileRow=None, tileCol=None):
     """
@@ -346,20 +461,23 @@ def get_collection_tiles_data(collection_id=None, tileMatrixSetId=None,
     :returns: HTTP response
     """
 
-    headers, status_code, content = api_.get_collection_tiles_data(
-        request.headers, request.args, collection_id,
-        tileMatrixSetId, tileMatrix, tileRow, tileCol)
+    response = get_response(*cached_tile(
+        collection_id, tileMatrixSetId, tileMatrix, tileRow, tileCol,
+        request.headers, request.args))
 
-    response = make_response(content, status_code)
-
-    if headers:
-        response.headers = headers
+    # tiles only change with the underlying data: let clients cache them
+    if response.status_code in (200, 202, 304):
+        response.headers['Cache-Control'] = 'public, max-age={}'.format(
+            TILES_MAX_AGE)
+    response.vary.add('Accept')
 
     return response
 
 
 @BLUEPRINT.route('/processes', methods=['GET', 'POST'])
+@BLUEPRINT.route('/processes/', methods=['GET', 'POST'])
 @BLUEPRINT.route('/processes/<process_id>', methods=['GET', 'POST'])
+@BLUEPRINT.route('/processes/<process_id>/', methods=['GET', 'POST'])
 def get_processes(process_id=None):
     """
     OGC API - Processes description endpoint
@@ -368,26 +486,22 @@ def get_processes(process_id=None):
 
     :returns: HTTP response
     """
-    # work around bug where json data is sent as form
-    data = request.stream.read()
     if request.method == 'POST':
         if not process_id:
             raise NotImplementedError("Creating new processes is currently not supported")
         else:
-            headers, status_code, content = api_.create_deferred_process(
+            # work around bug where json data is sent as form
+            data = request.get_data(cache=False, parse_form_data=False)
+            result = api_.create_deferred_process(
                 request.headers, request.args, data, process_id)
     else:
-        headers, status_code, content = api_.describe_processes(
+        result = api_.describe_processes(
             request.headers, request.args, process_id)
 
-    response = make_response(content, status_code)
-
-    if headers:
-        response.headers = headers
+    return get_response(result)
 
-    return response
-
-@BLUEPRINT.route('/processes/<process_id>/deferred/<deferred_id>', methods=['GET', 'POST'])
+@BLUEPRINT.route('/processes/<process_id>/deferred/<deferred_id>', methods=['GET', 'POST'])  # noqa
+@BLUEPRINT.route('/processes/<process_id>/deferred/<deferred_id>/', methods=['GET', 'POST'])  # noqa
 def get_deferred_process(process_id, deferred_id):
     return api_.describe_deferred_process(
         process_id=process_id,
@@ -395,42 +509,34 @@ def get_deferred_process(process_id, deferred_id):
     )
 
 
-@BLUEPRINT.route('/processes/<process_id>/deferred/<deferred_id>/coverage', methods=['GET', 'POST'])
+@BLUEPRINT.route('/processes/<process_id>/deferred/<deferred_id>/coverage', methods=['GET', 'POST'])  # noqa
+@BLUEPRINT.route('/processes/<process_id>/deferred/<deferred_id>/coverage/', methods=['GET', 'POST'])  # noqa
 def execute_deferred_process(process_id, deferred_id):
     return execute_coverage_process(process_id=deferred_id)
 
 
 @BLUEPRINT.route('/processes/<process_id>/coverage', methods=['POST', 'GET'])
+@BLUEPRINT.route('/processes/<process_id>/coverage/', methods=['POST', 'GET'])
 def execute_coverage_process(process_id):
-    headers, status_code, content = api_.execute_coverage_process(
+    return get_response(api_.execute_coverage_process(
         headers=request.headers,
         args=request.args,
         data=request.data,
         process_id=process_id,
-    )
-
-    response = make_response(content, status_code)
-
-    if headers:
-        response.headers = headers
-
-    return response
+    ))
 
 @BLUEPRINT.route('/processes/<process_id>/collection', methods=['GET'])
+@BLUEPRINT.route('/processes/<process_id>/collection/', methods=['GET'])
 def get_coverage_collection_document(process_id):
-    headers, status_code, content = api_.describe_coverage_process(process_id)
-
-    response = make_response(content, status_code)
-
-    if headers:
-        response.headers = headers
-
-    return response
+    return get_response(api_.describe_coverage_process(process_id))
 
 
 @BLUEPRINT.route('/processes/<process_id>/jobs', methods=['GET', 'POST'])
+@BLUEPRINT.route('/processes/<process_id>/jobs/', methods=['GET', 'POST'])
 @BLUEPRINT.route('/processes/<process_id>/jobs/<job_id>',
                  methods=['GET', 'DELETE'])
+@BLUEPRINT.route('/processes/<process_id>/jobs/<job_id>/',
+                 methods=['GET', 'DELETE'])
 def get_process_jobs(process_id=None, job_id=None):
     """
     OGC API - Processes jobs endpoint
@@ -443,28 +549,25 @@ def get_process_jobs(process_id=None, job_id=None):
 
     if job_id is None:
         if request.method == 'GET':  # list jobs
-            headers, status_code, content = api_.get_process_jobs(
+            result = api_.get_process_jobs(
                 request.headers, request.args, process_id)
         elif request.method == 'POST':  # submit job
-            headers, status_code, content = api_.execute_process(
+            result = api_.execute_process(
                 request.headers, request.args, request.data, process_id)
     else:
         if request.method == 'DELETE':  # dismiss job
-            headers, status_code, content = api_.delete_process_job(
+            result = api_.delete_process_job(
                 process_id, job_id)
         else:  # Return status of a specific job
-            headers, status_code, content = api_.get_process_jobs(
+            result = api_.get_process_jobs(
                 request.headers, request.args, process_id, job_id)
 
-    response = make_response(content, status_code)
-
-    if headers:
-        response.headers = headers
-
-    return response
+    return get_response(result)
 
 
 @APP.route('/processes/<process_id>/jobs/<job_id>/results', methods=['GET'])
+@APP.route('/processes/<process_id>/jobs/<job_id>/results/',
+           methods=['GET'])
 def get_process_job_result(process_id=None, job_id=None):
     """
     OGC API - Processes job result endpoint
@@ -475,19 +578,14 @@ def get_process_job_result(process_id=None, job_id=None):
     :returns: HTTP response
     """
 
-    headers, status_code, content = api_.get_process_job_result(
-        request.headers, request.args, process_id, job_id)
-
-    response = make_response(content, status_code)
-
-    if headers:
-        response.headers = headers
-
-    return response
+    return get_response(api_.get_process_job_result(
+        request.headers, request.args, process_id, job_id))
 
 
 @APP.route('/processes/<process_id>/jobs/<job_id>/results/<resource>',
            methods=['GET'])
+@APP.route('/processes/<process_id>/jobs/<job_id>/results/<resource>/',
+           methods=['GET'])
 def get_process_job_result_resource(process_id, job_id, resource):
     """
     OGC API - Processes job result resource endpoint
@@ -499,18 +597,12 @@ def get_process_job_result_resource(process_id, job_id, resource):
     :returns: HTTP response
     """
 
-    headers, status_code, content = api_.get_process_job_result_resource(
-        request.headers, request.args, process_id, job_id, resource)
-
-    response = make_response(content, status_code)
-
-    if headers:
-        response.headers = headers
-
-    return response
+    return get_response(api_.get_process_job_result_resource(
+        request.headers, request.args, process_id, job_id, resource))
 
 
 @BLUEPRINT.route('/stac')
+@BLUEPRINT.route('/stac/')
 def stac_catalog_root():
     """
     STAC root endpoint
@@ -518,15 +610,8 @@ def stac_catalog_root():
     :returns: HTTP response
     """
 
-    headers, status_code, content = api_.get_stac_root(
-        request.headers, request.args)
-
-    response = make_response(content, status_code)
-
-    if headers:
-        response.headers = headers
-
-    return response
+    return get_response(api_.get_stac_root(
+        request.headers, request.args))
 
 
 @BLUEPRINT.route('/stac/<path:path>')
@@ -539,15 +624,8 @@ def stac_catalog_path(path):
     :returns: HTTP response
     """
 
-    headers, status_code, content = api_.get_stac_path(
-        request.headers, request.args, path)
-
-    response = make_response(content, status_code)
-
-    if headers:
-        response.headers = headers
-
-    return response
+    return get_response(api_.get_stac_path(
+        request.headers, request.args, path))
 
 
 APP.register_blueprint(BLUEPRINT)
@@ -568,7 +646,8 @@ def serve(ctx, server=None, debug=False):
     """
 
     # setup_logger(CONFIG['logging'])
-    APP.run(debug=True, host=api_.config['server']['bind']['host'],
+    APP.run(debug=debug, threaded=True,
+            host=api_.config['server']['bind']['host'],
             port=api_.config['server']['bind']['port'])
 
 
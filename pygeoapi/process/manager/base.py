@@ -27,17 +27,66 @@
 #
 # =================================================================
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import io
 import json
 import logging
-from multiprocessing import dummy
 import os
 
-from pygeoapi.util import DATETIME_FORMAT, JobStatus
+import orjson
+
+from pygeoapi.util import JobStatus, json_serial
 
 LOGGER = logging.getLogger(__name__)
 
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+
+def _utcnow_iso():
+    """
+    Current UTC time formatted as `pygeoapi.util.DATETIME_FORMAT`,
+    without going through `datetime.strftime`
+
+    :returns: `str` of current UTC timestamp
+    """
+
+    t = datetime.utcnow()
+    return (f'{t.year:04d}-{t.month:02d}-{t.day:02d}T'
+            f'{t.hour:02d}:{t.minute:02d}:{t.second:02d}.'
+            f'{t.microsecond:06d}Z')
+
+
+def _write_job_output(filename, outputs):
+    """
+    Write job outputs to disk as JSON
+
+    orjson output is written as bytes directly; outputs orjson cannot
+    serialize are streamed through `json.dump` instead, formatted the
+    same way (2 space indent, sorted keys, no ASCII escaping)
+
+    :param filename: path of job output file
+    :param outputs: job outputs
+
+    :returns: `None`
+    """
+
+    option = (orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS |
+              orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
+    try:
+        data = orjson.dumps(outputs, default=json_serial, option=option)
+    except TypeError as err:
+        LOGGER.debug('orjson serialization failed: {}'.format(err))
+        with io.open(filename, 'w', encoding='utf-8',
+                     buffering=OUTPUT_BUFFER_SIZE) as fh:
+            json.dump(outputs, fh, default=json_serial, sort_keys=True,
+                      indent=2, ensure_ascii=False)
+        return
+
+    with io.open(filename, 'wb') as fh:
+        fh.write(data)
+
 
 class BaseManager:
     """generic Manager ABC"""
@@ -56,6 +105,17 @@ class BaseManager:
         self.connection = manager_def.get('connection', None)
         self.output_dir = manager_def.get('output_dir', None)
 
+        if self.output_dir is not None:
+            # resolve once, and create the directory at startup if missing
+            self.output_dir = os.path.realpath(self.output_dir)
+            os.makedirs(self.output_dir, exist_ok=True)
+
+        # shared worker pool for asynchronous jobs (threads spawn lazily)
+        self._executor = ThreadPoolExecutor(
+            max_workers=manager_def.get('max_workers', None),
+            thread_name_prefix='pygeoapi-job')
+        self._futures = {}
+
     def get_jobs(self, process_id=None, status=None):
         """
         Get process jobs, optionally filtered by status
@@ -132,9 +192,10 @@ class BaseManager:
     def _execute_handler_async(self, p, job_id, data_dict):
         """
         This private execution handler executes a process in a background
-        thread using `multiprocessing.dummy`
+        thread using a `concurrent.futures.ThreadPoolExecutor` shared by
+        all jobs of this manager
 
-        https://docs.python.org/3/library/multiprocessing.html#module-multiprocessing.dummy  # noqa
+        https://docs.python.org/3/library/concurrent.futures.html#threadpoolexecutor  # noqa
 
         :param p: `pygeoapi.process` object
         :param job_id: job identifier
@@ -143,45 +204,92 @@ class BaseManager:
         :returns: tuple of None (i.e. initial response payload)
                   and JobStatus.accepted (i.e. initial job status)
         """
-        _process = dummy.Process(
-            target=self._execute_handler_sync,
-            args=(p, job_id, data_dict)
-        )
-        _process.start()
+
+        # add the job before queueing it, so that it can be polled
+        # (and deleted) while waiting for a worker
+        self._add_new_job(p, job_id, JobStatus.accepted)
+
+        future = self._executor.submit(
+            self._execute_handler_sync, p, job_id, data_dict, True)
+        self._futures[job_id] = future
+        future.add_done_callback(
+            lambda _: self._futures.pop(job_id, None))
         return None, JobStatus.accepted
 
-    def _execute_handler_sync(self, p, job_id, data_dict):
+    def _cancel_job(self, job_id):
         """
-        Synchronous execution handler
+        Cancel an asynchronous job which has not started executing yet
 
-        If the manager has defined `output_dir`, then the result
-        will be written to disk
-        output store. There is no clean-up of old process outputs.
+        :param job_id: job identifier
+
+        :returns: `bool` of whether the job was cancelled
+        """
+
+        future = self._futures.pop(job_id, None)
+        if future is None:
+            return False
+
+        return future.cancel()
+
+    def _add_new_job(self, p, job_id, status):
+        """
+        Add a new job, either accepted (i.e. queued) or already running
 
         :param p: `pygeoapi.process` object
         :param job_id: job identifier
-        :param data_dict: `dict` of data parameters
+        :param status: `JobStatus` of the new job
 
-        :returns: tuple of response payload and status
+        :returns: `str` added job identifier
         """
 
-        process_id = p.metadata['id']
-        current_status = JobStatus.accepted
+        if status == JobStatus.running:
+            message = 'Job running'
+        else:
+            message = 'Job accepted and ready for execution'
 
         job_metadata = {
             'identifier': job_id,
-            'process_id': process_id,
-            'job_start_datetime': datetime.utcnow().strftime(
-                DATETIME_FORMAT),
+            'process_id': p.metadata['id'],
+            'job_start_datetime': _utcnow_iso(),
             'job_end_datetime': None,
-            'status': current_status.value,
+            'status': status.value,
             'location': None,
             'mimetype': None,
-            'message': 'Job accepted and ready for execution',
+            'message': message,
             'progress': 5
         }
 
-        self.add_job(job_metadata)
+        return self.add_job(job_metadata)
+
+    def _execute_handler_sync(self, p, job_id, data_dict, job_added=False):
+        """
+        Synchronous execution handler
+
+        If the manager has defined `output_dir`, then the result
+        will be written to disk
+        output store. There is no clean-up of old process outputs.
+
+        :param p: `pygeoapi.process` object
+        :param job_id: job identifier
+        :param data_dict: `dict` of data parameters
+        :param job_added: `bool` of whether the job was already added
+                          (i.e. queued by `_execute_handler_async`)
+
+        :returns: tuple of response payload and status
+        """
+
+        process_id = p.metadata['id']
+        current_status = JobStatus.running
+
+        if job_added:
+            # queued by _execute_handler_async: accepted -> running
+            self.update_job(process_id, job_id, {
+                'job_start_datetime': _utcnow_iso(),
+                'status': current_status.value,
+                'message': 'Job running'
+            })
+        else:
+            self._add_new_job(p, job_id, current_status)
 
         try:
             if self.output_dir is not None:
@@ -192,25 +300,16 @@ class BaseManager:
 
             jfmt = p.metadata['outputs'][0]['output']['formats'][0]['mimeType']
 
-            current_status = JobStatus.running
             outputs = p.execute(data_dict)
 
-            self.update_job(process_id, job_id, {
-                'status': current_status.value,
-                'message': 'Writing job output',
-                'progress': 95
-            })
-
             if self.output_dir is not None:
                 LOGGER.debug('writing output to {}'.format(job_filename))
-                with io.open(job_filename, 'w', encoding='utf-8') as fh:
-                    fh.write(json.dumps(outputs, sort_keys=True, indent=4))
+                _write_job_output(job_filename, outputs)
 
             current_status = JobStatus.successful
 
             job_update_metadata = {
-                'job_end_datetime': datetime.utcnow().strftime(
-                    DATETIME_FORMAT),
+                'job_end_datetime': _utcnow_iso(),
                 'status': current_status.value,
                 'location': job_filename,
                 'mimetype': jfmt,
@@ -237,8 +336,7 @@ class BaseManager:
             }
             LOGGER.error(err)
             job_metadata = {
-                'job_end_datetime': datetime.utcnow().strftime(
-                    DATETIME_FORMAT),
+                'job_end_datetime': _utcnow_iso(),
                 'status': current_status.value,
                 'location': None,
                 'mimetype': None,
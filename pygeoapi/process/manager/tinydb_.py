@@ -28,14 +28,13 @@
 # =================================================================
 
 import io
-import json
 import logging
 import os
 
 import tinydb
 
 from pygeoapi.process.manager.base import BaseManager
-from pygeoapi.util import JobStatus
+from pygeoapi.util import JobStatus, json_loads
 
 LOGGER = logging.getLogger(__name__)
 
@@ -140,6 +139,9 @@ class TinyDBManager(BaseManager):
 
         :return `bool` of status result
         """
+        # drop job from the worker queue if it has not started yet
+        cancelled = self._cancel_job(job_id)
+
         # delete result file if present
         job_result = self.get_job(process_id, job_id)
         if job_result:
@@ -151,7 +153,7 @@ class TinyDBManager(BaseManager):
         removed = bool(self.db.remove(tinydb.where('identifier') == job_id))
         self.db.close()
 
-        return removed
+        return removed or cancelled
 
     def get_job(self, process_id, job_id):
         """
@@ -200,7 +202,7 @@ class TinyDBManager(BaseManager):
             return (None,)
 
         with io.open(location, 'r', encoding='utf-8') as filehandler:
-            result = json.load(filehandler)
+            result = json_loads(filehandler.read())
 
         return mimetype, result
 
@@ -44,13 +44,20 @@ from pygeoapi.api import API
 from pygeoapi.util import yaml_load
 
 CONFIG = None
+OPENAPI = None
 
 if 'PYGEOAPI_CONFIG' not in os.environ:
     raise RuntimeError('PYGEOAPI_CONFIG environment variable not set')
 
+if 'PYGEOAPI_OPENAPI' not in os.environ:
+    raise RuntimeError('PYGEOAPI_OPENAPI environment variable not set')
+
 with open(os.environ.get('PYGEOAPI_CONFIG'), encoding='utf8') as fh:
     CONFIG = yaml_load(fh)
 
+with open(os.environ.get('PYGEOAPI_OPENAPI'), encoding='utf8') as fh:
+    OPENAPI = yaml_load(fh)
+
 STATIC_DIR = '{}{}static'.format(os.path.dirname(os.path.realpath(__file__)),
                                  os.sep)
 if 'templates' in CONFIG['server']:
@@ -102,11 +109,8 @@ async def openapi(request: Request):
     :returns: Starlette HTTP Response
     """
 
-    with open(os.environ.get('PYGEOAPI_OPENAPI'), encoding='utf8') as ff:
-        openapi = yaml_load(ff)
-
     headers, status_code, content = api_.openapi(
-        request.headers, request.query_params, openapi)
+        request.headers, request.query_params, OPENAPI)
 
     response = Response(content=content, status_code=status_code)
     if headers:
@@ -45,6 +45,7 @@ from urllib.parse import urlparse
 import dateutil.parser
 from jinja2 import Environment, FileSystemLoader
 from jinja2.exceptions import TemplateNotFound
+import orjson
 import yaml
 
 from pygeoapi import __version__
@@ -121,7 +122,8 @@ def yaml_load(fh):
             raise EnvironmentError('Undefined environment variable in config')
         return get_typed_value(os.path.expandvars(node.value))
 
-    class EnvVarLoader(yaml.SafeLoader):
+    # prefer the libyaml C binding when PyYAML was built with it
+    class EnvVarLoader(getattr(yaml, 'CSafeLoader', yaml.SafeLoader)):
         pass
 
     EnvVarLoader.add_implicit_resolver('!path', path_matcher, None)
@@ -160,13 +162,63 @@ def to_json(dict_, pretty=False):
     :returns: JSON string representation
     """
 
+    return json_dumps(dict_, pretty=pretty)
+
+
+def json_dumps(obj, pretty=False, sort_keys=False):
+    """
+    Serialize object to JSON using orjson
+
+    NaN and Infinity are serialized as null, non-ASCII characters are
+    not escaped and pretty printing indents by 2 spaces.  Values orjson
+    cannot serialize (e.g. integers beyond 64 bit) are handled by the
+    json module, formatted the same way.
+
+    :param obj: object to serialize
+    :param pretty: `bool` of whether to prettify JSON (default is `False`)
+    :param sort_keys: `bool` of whether to sort keys (default is `False`)
+
+    :returns: JSON string representation
+    """
+
+    option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
     if pretty:
-        indent = 4
+        option |= orjson.OPT_INDENT_2
+    if sort_keys:
+        option |= orjson.OPT_SORT_KEYS
+
+    try:
+        return orjson.dumps(obj, default=json_serial,
+                            option=option).decode('utf-8')
+    except TypeError as err:
+        LOGGER.debug('orjson serialization failed: {}'.format(err))
+
+    if pretty:
+        indent, separators = 2, (',', ': ')
     else:
-        indent = None
+        indent, separators = None, (',', ':')
+
+    return json.dumps(obj, default=json_serial, indent=indent,
+                      separators=separators, sort_keys=sort_keys,
+                      ensure_ascii=False)
+
+
+def json_loads(data):
+    """
+    Deserialize JSON using orjson
+
+    :param data: `str` or `bytes` of JSON
+
+    :returns: deserialized object
+    """
+
+    try:
+        return orjson.loads(data)
+    except ValueError as err:
+        # e.g. NaN/Infinity literals; let the json module handle it
+        LOGGER.debug('orjson deserialization failed: {}'.format(err))
 
-    return json.dumps(dict_, default=json_serial,
-                      indent=indent)
+    return json.loads(data)
 
 
 def format_datetime(value, format_=DATETIME_FORMAT):
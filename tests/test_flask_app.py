@@ -0,0 +1,150 @@
+# =================================================================
+#
+# Authors: Tom Kralidis <tomkralidis@gmail.com>
+#
+# Copyright (c) 2020 Tom Kralidis
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use,
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# =================================================================
+
+
+import importlib
+import os
+import sys
+from unittest import mock
+
+import pytest
+import yaml
+
+from pygeoapi.util import yaml_load
+
+
+def get_test_file_path(filename):
+    """helper function to open test file safely"""
+
+    if os.path.isfile(filename):
+        return filename
+    else:
+        return 'tests/{}'.format(filename)
+
+
+@pytest.fixture()
+def load_flask_app(monkeypatch, tmp_path):
+    """(Re)import pygeoapi.flask_app with test server settings"""
+
+    def load(**server):
+        with open(get_test_file_path('pygeoapi-test-config.yml')) as fh:
+            config = yaml_load(fh)
+        config['server'].update(server)
+
+        config_file = tmp_path / 'pygeoapi-config.yml'
+        config_file.write_text(yaml.safe_dump(config))
+
+        monkeypatch.setenv('PYGEOAPI_CONFIG', str(config_file))
+        monkeypatch.setenv('PYGEOAPI_OPENAPI',
+                           get_test_file_path('pygeoapi-test-openapi.yml'))
+        monkeypatch.delitem(sys.modules, 'pygeoapi.flask_app',
+                            raising=False)
+
+        return importlib.import_module('pygeoapi.flask_app')
+
+    return load
+
+
+def test_etag(load_flask_app):
+    flask_app = load_flask_app()
+    client = flask_app.APP.test_client()
+
+    with mock.patch.object(flask_app, 'compute_etag',
+                           wraps=flask_app.compute_etag) as compute_etag:
+        response = client.get('/?f=json')
+        assert response.status_code == 200
+        etag = response.headers['ETag']
+
+        response = client.get('/?f=json', headers={'If-None-Match': etag})
+        assert response.status_code == 304
+
+        # computed once, when the landing page was cached
+        assert compute_etag.call_count == 1
+
+    url = '/collections/obs/items?f=json'
+    assert 'ETag' in client.get(url).headers
+
+    # large uncached responses are not hashed
+    flask_app.ETAG_MAX_CONTENT_LENGTH = 0
+    assert 'ETag' not in client.get(url).headers
+
+
+def test_tiles_cache(load_flask_app):
+    flask_app = load_flask_app()
+    client = flask_app.APP.test_client()
+    url = '/collections/lakes/tiles/WorldCRS84Quad/0/0/0?f=mvt'
+
+    with mock.patch.object(flask_app.api_, 'get_collection_tiles_data',
+                           wraps=flask_app.api_.get_collection_tiles_data
+                           ) as get_tile:
+        response = client.get(url)
+        assert response.status_code == 202
+        assert response.headers['Cache-Control'] == 'public, max-age=3600'
+        assert 'Accept' in response.vary
+
+        cached_response = client.get(url)
+        assert cached_response.data == response.data
+        assert get_tile.call_count == 1
+
+        # expired tiles are fetched again
+        flask_app.TILES_MAX_AGE = 0
+        assert client.get(url).data == response.data
+        assert get_tile.call_count == 2
+
+
+def test_tiles_cache_disabled(load_flask_app):
+    flask_app = load_flask_app(tiles_cache_size=0)
+    client = flask_app.APP.test_client()
+    url = '/collections/lakes/tiles/WorldCRS84Quad/0/0/0?f=mvt'
+
+    client.get(url)
+    client.get(url)
+    assert not flask_app.TILES_CACHE
+
+
+@pytest.mark.parametrize('path,status_code', [
+    ('ogcapi/common.json', 200),
+    ('ogcapi/missing.json', 404),
+    ('../secret.txt', 403),
+    ('ogcapi/../../secret.txt', 403),
+    ('%2e%2e/secret.txt', 403),
+    ('ogcapi/%2e%2e/%2e%2e/secret.txt', 403)
+])
+def test_schemas(load_flask_app, tmp_path, path, status_code):
+    schemas_dir = tmp_path / 'schemas'
+    (schemas_dir / 'ogcapi').mkdir(parents=True)
+    (schemas_dir / 'ogcapi' / 'common.json').write_text('{}')
+    (tmp_path / 'secret.txt').write_text('secret')
+
+    flask_app = load_flask_app(ogc_schemas_location=str(schemas_dir))
+    client = flask_app.APP.test_client()
+
+    response = client.get('/schemas/{}'.format(path))
+    assert response.status_code == status_code
+    assert b'secret' not in response.data
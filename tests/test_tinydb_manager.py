@@ -0,0 +1,135 @@
+# =================================================================
+#
+# Authors: Tom Kralidis <tomkralidis@gmail.com>
+#
+# Copyright (c) 2020 Tom Kralidis
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use,
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# =================================================================
+
+
+import json
+import threading
+from unittest import mock
+
+import pytest
+
+from pygeoapi.process.base import BaseProcessor
+from pygeoapi.process.manager.tinydb_ import TinyDBManager
+from pygeoapi.util import JobStatus
+
+PROCESS_METADATA = {
+    'id': 'slow',
+    'outputs': [{
+        'output': {'formats': [{'mimeType': 'application/json'}]}
+    }]
+}
+
+
+class SlowProcessor(BaseProcessor):
+    """Processor which blocks until released"""
+
+    def __init__(self):
+        super().__init__({'name': 'Slow'}, PROCESS_METADATA)
+        self.started = threading.Event()
+        self.released = threading.Event()
+
+    def execute(self, data):
+        self.started.set()
+        self.released.wait(10)
+        return {'id': data['id']}
+
+
+@pytest.fixture()
+def manager(tmp_path):
+    manager_ = TinyDBManager({
+        'name': 'TinyDB',
+        'connection': str(tmp_path / 'jobs.db'),
+        'output_dir': str(tmp_path / 'outputs'),
+        'max_workers': 1
+    })
+    yield manager_
+    manager_._executor.shutdown(wait=True)
+
+
+def test_queued_job_can_be_polled_and_deleted(manager):
+    p = SlowProcessor()
+
+    result = manager.execute_process(p, 'job1', {'id': 1}, is_async=True)
+    assert result == (None, JobStatus.accepted)
+    assert p.started.wait(10)
+
+    # the only worker is busy, so job2 waits in the queue
+    manager.execute_process(p, 'job2', {'id': 2}, is_async=True)
+
+    assert manager.get_job('slow', 'job1')['status'] == 'running'
+    assert manager.get_job('slow', 'job2')['status'] == 'accepted'
+
+    assert manager.delete_job('slow', 'job2')
+    assert manager.get_job('slow', 'job2') is None
+
+    p.released.set()
+    manager._executor.shutdown(wait=True)
+
+    assert manager.get_job('slow', 'job1')['status'] == 'successful'
+    assert manager.get_job('slow', 'job2') is None
+    assert manager.get_job_result('slow', 'job1') == (
+        'application/json', {'id': 1})
+
+
+@pytest.mark.parametrize('value', [
+    'é',
+    # beyond orjson's 64 bit integers, written by the json module
+    2 ** 64
+])
+def test_job_output_written_to_output_dir(manager, value):
+    p = SlowProcessor()
+    p.released.set()
+
+    outputs, status = manager.execute_process(p, 'job', {'id': value})
+    assert status == JobStatus.successful
+
+    job = manager.get_job('slow', 'job')
+    with open(job['location'], encoding='utf-8') as fh:
+        assert fh.read() == '{{\n  "id": {}\n}}'.format(
+            json.dumps(value, ensure_ascii=False))
+
+    assert manager.get_job_result('slow', 'job') == (
+        'application/json', {'id': value})
+
+
+def test_sync_job_writes(manager):
+    p = SlowProcessor()
+    p.released.set()
+
+    with mock.patch.object(manager, 'add_job',
+                           wraps=manager.add_job) as add_job, \
+            mock.patch.object(manager, 'update_job',
+                              wraps=manager.update_job) as update_job:
+        manager.execute_process(p, 'job', {'id': 1})
+
+    # added as running, then updated once with the final state
+    assert add_job.call_count == 1
+    assert add_job.call_args[0][0]['status'] == 'running'
+    assert update_job.call_count == 1
+    assert manager.get_job('slow', 'job')['status'] == 'successful'
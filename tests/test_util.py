@@ -99,6 +99,40 @@ def test_json_serial():
         util.json_serial('foo')
 
 
+def test_json_dumps_loads():
+    d = {
+        'b': datetime(1972, 10, 30),
+        'a': Decimal(1.5),
+        'c': [1, 'two', None]
+    }
+
+    value = util.json_dumps(d, sort_keys=True)
+    assert value.replace(' ', '') == \
+        '{"a":1.5,"b":"1972-10-30T00:00:00","c":[1,"two",null]}'
+
+    assert util.json_loads(util.json_dumps(d, pretty=True)) == {
+        'a': 1.5,
+        'b': '1972-10-30T00:00:00',
+        'c': [1, 'two', None]
+    }
+
+    assert '18446744073709551616' in util.json_dumps({'big': 2 ** 64})
+
+
+def test_json_dumps_output():
+    d = {'a': float('nan'), 'b': 'é', 'c': [1]}
+
+    assert util.json_dumps(d) == '{"a":null,"b":"é","c":[1]}'
+    assert util.to_json(d, pretty=True) == \
+        '{\n  "a": null,\n  "b": "é",\n  "c": [\n    1\n  ]\n}'
+
+    # the json module fallback is formatted the same way
+    assert util.json_dumps({'b': 'é', 'big': 2 ** 64}) == \
+        '{"b":"é","big":18446744073709551616}'
+    assert util.json_dumps({'b': 'é', 'big': 2 ** 64}, pretty=True) == \
+        '{\n  "b": "é",\n  "big": 18446744073709551616\n}'
+
+
 def test_mimetype():
     assert util.get_mimetype('file.xml') == 'application/xml'
     assert util.get_mimetype('file.yml') == 'text/plain'